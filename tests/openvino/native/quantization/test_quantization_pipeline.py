@@ -21,7 +21,8 @@ from tests.openvino.native.common import get_dataset_for_test
 from tests.openvino.native.models import ConvModel
 from tests.openvino.native.models import LinearModel
 from tests.openvino.native.models import MatMul2DModel
-from tests.openvino.native.test_model_transformer import get_fq_nodes
+
+_OV_I8 = ov.Type(np.int8)
 
 REF_FQ_NODES = [
     (("MatMul", 1), ["Input/fq_output_0"]),
@@ -29,63 +30,80 @@ REF_FQ_NODES = [
     (("MatMul", 1), ["Input/fq_output_0"]),
 ]
 
+QUANTIZE_PARAMETERS = {
+    "preset": QuantizationPreset.PERFORMANCE,
+    "target_device": TargetDevice.CPU,
+    "subset_size": 1,
+    "fast_bias_correction": True,
+}
+
+
+@pytest.fixture(scope="session")
+def quantized_model_cache():
+    return {}
+
+
+def get_or_quantize(cache, model_creator_func, **quantize_parameters):
+    """
+    Returns the quantized model for the given model creator and quantization parameters.
+    The quantization pipeline is run only on the first request, subsequent calls reuse the cached result.
+    """
+    key = (model_creator_func.__name__, tuple(sorted((k, repr(v)) for k, v in quantize_parameters.items())))
+    if key not in cache:
+        model = model_creator_func().ov_model
+        dataset = get_dataset_for_test(model)
+        cache[key] = quantize_impl(model, dataset, **quantize_parameters)
+    return cache[key]
+
+
+def check_fq_nodes_and_get_op(quantized_model, ref_fqs_names, op_name):
+    """
+    Checks FakeQuantize nodes of the model against the reference names and returns the op with the given name.
+    Both are collected in a single pass over the model operations.
+    """
+    fq_nodes = []
+    target_op = None
+    for op in quantized_model.get_ops():
+        friendly_name = op.get_friendly_name()
+        if op.get_type_name() == "FakeQuantize":
+            fq_nodes.append(friendly_name)
+        if friendly_name == op_name:
+            target_op = op
 
-@pytest.mark.parametrize("model_creator_func, ref_nodes", zip([LinearModel, ConvModel, MatMul2DModel], REF_FQ_NODES))
-def test_compress_weights(model_creator_func, ref_nodes):
-    (quntized_op_name, inp_port), ref_fqs_names = ref_nodes
-    model = model_creator_func().ov_model
-    dataset = get_dataset_for_test(model)
-    quantized_model = quantize_impl(
-        model,
-        dataset,
-        preset=QuantizationPreset.PERFORMANCE,
-        target_device=TargetDevice.CPU,
-        subset_size=1,
-        fast_bias_correction=True,
-    )
-
-    fq_nodes = get_fq_nodes(quantized_model)
     assert len(fq_nodes) == len(ref_fqs_names)
     for fq_name in fq_nodes:
         assert fq_name in ref_fqs_names
+    assert target_op is not None, f"{op_name} is not found in the quantized model"
+    return target_op
 
-    for op in quantized_model.get_ops():
-        if op.get_friendly_name() == quntized_op_name:
-            node = op.input_value(inp_port).get_node()
-            while node.get_type_name() != "Constant":
-                node = node.input_value(0).get_node()
-            assert node.get_element_type() == ov.Type(np.int8)
-            break
+
+@pytest.mark.parametrize("model_creator_func, ref_nodes", zip([LinearModel, ConvModel, MatMul2DModel], REF_FQ_NODES))
+def test_compress_weights(quantized_model_cache, model_creator_func, ref_nodes):
+    (quntized_op_name, inp_port), ref_fqs_names = ref_nodes
+    quantized_model = get_or_quantize(quantized_model_cache, model_creator_func, **QUANTIZE_PARAMETERS)
+
+    quantized_op = check_fq_nodes_and_get_op(quantized_model, ref_fqs_names, quntized_op_name)
+
+    node = quantized_op.input_value(inp_port).get_node()
+    while node.get_type_name() != "Constant":
+        node = node.input_value(0).get_node()
+    assert node.get_element_type() == _OV_I8
 
 
 @pytest.mark.parametrize("model_creator_func, ref_nodes", [[ConvModel, REF_FQ_NODES[1]]])
-def test_overflow_fix_applied(model_creator_func, ref_nodes):
+def test_overflow_fix_applied(quantized_model_cache, model_creator_func, ref_nodes):
     (quntized_op_name, inp_port), ref_fqs_names = ref_nodes
-    model = model_creator_func().ov_model
-    dataset = get_dataset_for_test(model)
-    quantized_model = quantize_impl(
-        model,
-        dataset,
-        preset=QuantizationPreset.PERFORMANCE,
-        target_device=TargetDevice.CPU,
-        subset_size=1,
-        fast_bias_correction=True,
-    )
-
-    fq_nodes = get_fq_nodes(quantized_model)
-    assert len(fq_nodes) == len(ref_fqs_names)
-    for fq_name in fq_nodes:
-        assert fq_name in ref_fqs_names
+    quantized_model = get_or_quantize(quantized_model_cache, model_creator_func, **QUANTIZE_PARAMETERS)
 
-    for op in quantized_model.get_ops():
-        if op.get_friendly_name() == quntized_op_name:
-            node = op.input_value(inp_port).get_node()
-            while node.get_type_name() != "Constant":
-                node = node.input_value(0).get_node()
-            assert node.get_element_type() == ov.Type(np.int8)
-            vector = node.get_vector()
-            assert np.min(vector) >= -64
-            assert np.max(vector) <= 64
+    quantized_op = check_fq_nodes_and_get_op(quantized_model, ref_fqs_names, quntized_op_name)
+
+    node = quantized_op.input_value(inp_port).get_node()
+    while node.get_type_name() != "Constant":
+        node = node.input_value(0).get_node()
+    assert node.get_element_type() == _OV_I8
+    weights = node.data
+    assert weights.min() >= -64
+    assert weights.max() <= 64
 
 
 IGNORED_OPTIONS = [IgnoredScope(names=["MatMul"]), IgnoredScope(names=["Conv"], types=["Add"]), IgnoredScope()]
@@ -94,7 +112,7 @@ IGNORED_OPTIONS = [IgnoredScope(names=["MatMul"]), IgnoredScope(names=["Conv"],
 @pytest.mark.parametrize(
     "model_creator_func, ignored_options", zip([LinearModel, ConvModel, MatMul2DModel], IGNORED_OPTIONS)
 )
-def test_meta_information(model_creator_func, ignored_options):
+def test_meta_information(quantized_model_cache, model_creator_func, ignored_options):
     def check_parameters(quantized_model, parameters, path):
         for key, value in parameters.items():
             rt_path = path + [key]
@@ -105,16 +123,8 @@ def test_meta_information(model_creator_func, ignored_options):
                 continue
             assert quantized_model.get_rt_info(rt_path) == str(value)
 
-    model = model_creator_func().ov_model
-    dataset = get_dataset_for_test(model)
-    quantize_parameters = {
-        "preset": QuantizationPreset.PERFORMANCE,
-        "target_device": TargetDevice.CPU,
-        "subset_size": 1,
-        "fast_bias_correction": True,
-        "ignored_scope": ignored_options,
-    }
-    quantized_model = quantize_impl(model, dataset, **quantize_parameters)
+    quantize_parameters = {**QUANTIZE_PARAMETERS, "ignored_scope": ignored_options}
+    quantized_model = get_or_quantize(quantized_model_cache, model_creator_func, **quantize_parameters)
 
     base_path = ["nncf", "quantization"]
     assert quantized_model.has_rt_info(base_path)